@@ -71,11 +71,11 @@ class Logger:
             lro (operation.Operation):
                 Optional. Backing LRO for creation.
         """
-        self._logger.info(f"Creating {cls.__name__}")
+        self._logger.info("Creating %s", cls.__name__)
 
         if lro:
             self._logger.info(
-                f"Create {cls.__name__} backing LRO: {lro.operation.name}"
+                "Create %s backing LRO: %s", cls.__name__, lro.operation.name
             )
 
     def log_create_complete(
@@ -96,10 +96,10 @@ class Logger:
             variable_name (str): Name of variable to use for code snippet
 
         """
-        self._logger.info(f"{cls.__name__} created. Resource name: {resource.name}")
-        self._logger.info(f"To use this {cls.__name__} in another session:")
+        self._logger.info("%s created. Resource name: %s", cls.__name__, resource.name)
+        self._logger.info("To use this %s in another session:", cls.__name__)
         self._logger.info(
-            f"{variable_name} = aiplatform.{cls.__name__}('{resource.name}')"
+            "%s = aiplatform.%s('%s')", variable_name, cls.__name__, resource.name
         )
 
     def log_action_start_against_resource(
@@ -114,7 +114,11 @@ class Logger:
                 Resource noun object the action is acting against.
         """
         self._logger.info(
-            f"{action} {resource_noun_obj.__class__.__name__} {noun}: {resource_noun_obj.resource_name}"
+            "%s %s %s: %s",
+            action,
+            resource_noun_obj.__class__.__name__,
+            noun,
+            resource_noun_obj.resource_name,
         )
 
     def log_action_started_against_resource_with_lro(
@@ -134,7 +138,7 @@ class Logger:
             lro (operation.Operation): Backing LRO for action.
         """
         self._logger.info(
-            f"{action} {cls.__name__} {noun} backing LRO: {lro.operation.name}"
+            "%s %s %s backing LRO: %s", action, cls.__name__, noun, lro.operation.name
         )
 
     def log_action_completed_against_resource(
@@ -149,7 +153,11 @@ class Logger:
                 Resource noun object the action is acting against
         """
         self._logger.info(
-            f"{resource_noun_obj.__class__.__name__} {noun} {action}. Resource name: {resource_noun_obj.resource_name}"
+            "%s %s %s. Resource name: %s",
+            resource_noun_obj.__class__.__name__,
+            noun,
+            action,
+            resource_noun_obj.resource_name,
         )
 
     def __getattr__(self, attr: str):
@@ -317,7 +325,7 @@ class FutureManager(metaclass=abc.ABCMeta):
             if self.__latest_future:
                 deps.append(self.__latest_future)
 
-            self.__latest_future = initializer.global_pool.submit(
+            self.__latest_future = initializer.get_global_pool().submit(
                 wait_for_dependencies_and_invoke,
                 deps=deps,
                 method=method,
@@ -18,9 +18,16 @@
 
 from concurrent import futures
 import logging
-import pkg_resources
 import os
-from typing import Optional, Type, Union
+import threading
+from typing import Dict, Optional, Tuple, Type, Union
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python < 3.8
+    import pkg_resources
+
+    importlib_metadata = None
 
 from google.api_core import client_options
 from google.api_core import gapic_v1
@@ -38,6 +45,32 @@ from google.cloud.aiplatform.compat.types import (
     encryption_spec_v1beta1 as gca_encryption_spec_v1beta1,
 )
 
+# ClientInfo shared by every client created through _Config.create_client.
+# Populated on first use since the package version never changes in-process.
+_CLIENT_INFO = None
+
+
+def _get_package_version() -> str:
+    """Returns the installed version of google-cloud-aiplatform."""
+    if importlib_metadata:
+        return importlib_metadata.version("google-cloud-aiplatform")
+    return pkg_resources.get_distribution("google-cloud-aiplatform").version
+
+
+def _get_client_info() -> gapic_v1.client_info.ClientInfo:
+    """Returns the model-builder ClientInfo, building it on first call."""
+    global _CLIENT_INFO
+    if _CLIENT_INFO is None:
+        gapic_version = _get_package_version()
+        _CLIENT_INFO = gapic_v1.client_info.ClientInfo(
+            gapic_version=gapic_version, user_agent=f"model-builder/{gapic_version}"
+        )
+    return _CLIENT_INFO
+
+
+# Regionalized ClientOptions keyed by validated, lower-cased region.
+_CLIENT_OPTIONS_CACHE: Dict[str, client_options.ClientOptions] = {}
+
 
 class _Config:
     """Stores common parameters and options for API calls."""
@@ -49,6 +82,8 @@ class _Config:
         self._staging_bucket = None
         self._credentials = None
         self._encryption_spec_key_name = None
+        self._default_credentials = None
+        self._default_project = None
 
     def init(
         self,
@@ -84,6 +119,7 @@ class _Config:
         """
         if project:
             self._project = project
+            self._default_project = None
         if location:
             utils.validate_region(location)
             self._location = location
@@ -94,6 +130,7 @@ class _Config:
             self._staging_bucket = staging_bucket
         if credentials:
             self._credentials = credentials
+            self._default_credentials = None
         if encryption_spec_key_name:
             self._encryption_spec_key_name = encryption_spec_key_name
 
@@ -139,7 +176,7 @@ class _Config:
         )
 
         try:
-            _, project_id = google.auth.default()
+            _, project_id = self._get_default_credentials_and_project()
         except GoogleAuthError:
             raise GoogleAuthError(project_not_found_exception_str)
 
@@ -168,13 +205,32 @@ class _Config:
         """Default credentials."""
         if self._credentials:
             return self._credentials
-        logger = logging.getLogger("google.auth._default")
-        logging_warning_filter = utils.LoggingWarningFilter()
-        logger.addFilter(logging_warning_filter)
-        credentials, _ = google.auth.default()
-        logger.removeFilter(logging_warning_filter)
+        credentials, _ = self._get_default_credentials_and_project()
         return credentials
 
+    def _get_default_credentials_and_project(
+        self,
+    ) -> Tuple[auth_credentials.Credentials, Optional[str]]:
+        """Resolves Application Default Credentials, caching the result.
+
+        google.auth.default() probes the environment, the filesystem and possibly
+        the metadata server, so it is only called until it succeeds once.
+
+        Returns:
+            A (credentials, project_id) tuple from the environment.
+        """
+        if self._default_credentials is None:
+            logger = logging.getLogger("google.auth._default")
+            logging_warning_filter = utils.LoggingWarningFilter()
+            logger.addFilter(logging_warning_filter)
+            try:
+                credentials, project_id = google.auth.default()
+            finally:
+                logger.removeFilter(logging_warning_filter)
+            self._default_credentials = credentials
+            self._default_project = project_id
+        return self._default_credentials, self._default_project
+
     @property
     def encryption_spec_key_name(self) -> Optional[str]:
         """Default encryption spec key name, if provided."""
@@ -196,6 +252,7 @@ class _Config:
                 A ClientOptions object set with regionalized API endpoint, i.e.
                 { "api_endpoint": "us-central1-aiplatform.googleapis.com" } or
                 { "api_endpoint": "asia-east1-aiplatform.googleapis.com" }
+                The object is shared between callers and must not be modified.
         """
         if not (self.location or location_override):
             raise ValueError(
@@ -205,11 +262,15 @@ class _Config:
         region = location_override or self.location
         region = region.lower()
 
-        utils.validate_region(region)
+        region_client_options = _CLIENT_OPTIONS_CACHE.get(region)
+        if region_client_options is None:
+            utils.validate_region(region)
+            region_client_options = client_options.ClientOptions(
+                api_endpoint=f"{region}-{constants.API_BASE_PATH}"
+            )
+            _CLIENT_OPTIONS_CACHE[region] = region_client_options
 
-        return client_options.ClientOptions(
-            api_endpoint=f"{region}-{constants.API_BASE_PATH}"
-        )
+        return region_client_options
 
     def common_location_path(
         self, project: Optional[str] = None, location: Optional[str] = None
@@ -225,13 +286,8 @@ class _Config:
         if location:
             utils.validate_region(location)
 
-        return "/".join(
-            [
-                "projects",
-                project or self.project,
-                "locations",
-                location or self.location,
-            ]
+        return (
+            f"projects/{project or self.project}/locations/{location or self.location}"
         )
 
     def create_client(
@@ -253,19 +309,12 @@ class _Config:
         Returns:
             client: Instantiated AI Platform Service client with optional overrides
         """
-        gapic_version = pkg_resources.get_distribution(
-            "google-cloud-aiplatform",
-        ).version
-        client_info = gapic_v1.client_info.ClientInfo(
-            gapic_version=gapic_version, user_agent=f"model-builder/{gapic_version}"
-        )
-
         kwargs = {
             "credentials": credentials or self.credentials,
             "client_options": self.get_client_options(
                 location_override=location_override
             ),
-            "client_info": client_info,
+            "client_info": _get_client_info(),
         }
 
         return client_class(**kwargs)
@@ -274,6 +323,25 @@ class _Config:
 # global config to store init parameters: ie, aiplatform.init(project=..., location=...)
 global_config = _Config()
 
-global_pool = futures.ThreadPoolExecutor(
-    max_workers=min(32, max(4, (os.cpu_count() or 0) * 5))
-)
+# global thread pool used to run asynchronous SDK calls, created on first use
+_global_pool = None
+_global_pool_lock = threading.Lock()
+
+
+def get_global_pool() -> futures.ThreadPoolExecutor:
+    """Returns the global thread pool, creating it on first call."""
+    global _global_pool
+    if _global_pool is None:
+        with _global_pool_lock:
+            if _global_pool is None:
+                _global_pool = futures.ThreadPoolExecutor(
+                    max_workers=min(32, max(4, (os.cpu_count() or 0) * 5))
+                )
+    return _global_pool
+
+
+def __getattr__(name: str):
+    """Keeps `initializer.global_pool` working while creating it lazily."""
+    if name == "global_pool":
+        return get_global_pool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
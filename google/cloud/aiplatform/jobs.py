@@ -166,12 +166,10 @@ class _Job(base.AiPlatformResourceNounWithFutureManager):
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
-                    "%s %s current state:\n%s"
-                    % (
-                        self.__class__.__name__,
-                        self._gca_resource.name,
-                        self._gca_resource.state,
-                    )
+                    "%s %s current state:\n%s",
+                    self.__class__.__name__,
+                    self._gca_resource.name,
+                    self._gca_resource.state,
                 )
                 log_wait = min(log_wait * multiplier, max_wait)
             previous_time = current_time
@@ -677,7 +675,7 @@ class BatchPredictionJob(_Job):
         _LOGGER.log_create_complete(cls, batch_prediction_job._gca_resource, "bpj")
 
         _LOGGER.info(
-            "View Batch Prediction Job:\n%s" % batch_prediction_job._dashboard_uri()
+            "View Batch Prediction Job:\n%s", batch_prediction_job._dashboard_uri()
         )
 
         batch_prediction_job._block_until_complete()
@@ -517,7 +517,7 @@ class _TrainingJob(base.AiPlatformResourceNounWithFutureManager):
 
         self._gca_resource = training_pipeline
 
-        _LOGGER.info("View Training:\n%s" % self._dashboard_uri())
+        _LOGGER.info("View Training:\n%s", self._dashboard_uri())
 
         model = self._get_model()
 
@@ -638,12 +638,10 @@ class _TrainingJob(base.AiPlatformResourceNounWithFutureManager):
             current_time = time.time()
             if current_time - previous_time >= log_wait:
                 _LOGGER.info(
-                    "%s %s current state:\n%s"
-                    % (
-                        self.__class__.__name__,
-                        self._gca_resource.name,
-                        self._gca_resource.state,
-                    )
+                    "%s %s current state:\n%s",
+                    self.__class__.__name__,
+                    self._gca_resource.name,
+                    self._gca_resource.state,
                 )
                 log_wait = min(log_wait * multiplier, max_wait)
                 previous_time = current_time
@@ -655,7 +653,7 @@ class _TrainingJob(base.AiPlatformResourceNounWithFutureManager):
 
         if self._gca_resource.model_to_upload and not self.has_failed:
             _LOGGER.info(
-                "Model available at %s" % self._gca_resource.model_to_upload.name
+                "Model available at %s", self._gca_resource.model_to_upload.name
             )
 
     def _raise_failure(self):
@@ -1008,7 +1006,7 @@ setup(
         with tempfile.TemporaryDirectory() as tmpdirname:
             source_distribution_path = self.make_package(tmpdirname)
             output_location = copy_method(source_distribution_path)
-            _LOGGER.info("Training script copied to:\n%s." % output_location)
+            _LOGGER.info("Training script copied to:\n%s.", output_location)
             return output_location
 
     def package_and_copy_to_gcs(
@@ -1539,7 +1537,7 @@ class _CustomTrainingJob(_TrainingJob):
             self._staging_bucket, "aiplatform-custom-training"
         )
 
-        _LOGGER.info("Training Output directory:\n%s " % base_output_dir)
+        _LOGGER.info("Training Output directory:\n%s ", base_output_dir)
 
         training_task_inputs = {
             "workerPoolSpecs": worker_pool_specs,
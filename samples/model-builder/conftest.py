@@ -12,16 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import ExitStack
 from unittest.mock import MagicMock, patch
 
 from google.cloud import aiplatform
 import pytest
 
 
+_AutoMLImageTrainingJob = aiplatform.training_jobs.AutoMLImageTrainingJob
+_CustomTrainingJob = aiplatform.training_jobs.CustomTrainingJob
+_Model = aiplatform.models.Model
+_BatchPredictionJob = aiplatform.jobs.BatchPredictionJob
+
+_DATASET_KINDS = {
+    "image": aiplatform.datasets.ImageDataset,
+    "tabular": aiplatform.datasets.TabularDataset,
+    "text": aiplatform.datasets.TextDataset,
+    "video": aiplatform.datasets.VideoDataset,
+}
+
+
+"""
+----------------------------------------------------------------------------
+Session Patches
+----------------------------------------------------------------------------
+"""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patched_aiplatform(_dataset_mocks, mock_endpoint):
+    """Patches every SDK entry point used by the samples once per session.
+
+    Return values are wired here once. The fixtures below hand out these
+    mocks to individual tests and reset their call history and side effects
+    first, so tests do not observe each other's calls.
+    """
+    with ExitStack() as stack:
+
+        def enter(target, attribute, **kwargs):
+            return stack.enter_context(patch.object(target, attribute, **kwargs))
+
+        mocks = {"sdk_init": enter(aiplatform, "init")}
+
+        for kind, dataset_class in _DATASET_KINDS.items():
+            mocks[f"get_{kind}_dataset"] = enter(
+                aiplatform, dataset_class.__name__, return_value=_dataset_mocks[kind]
+            )
+            # SomeDataset.create is an attribute of the patched class mock
+            mocks[f"create_{kind}_dataset"] = mocks[f"get_{kind}_dataset"].create
+            mocks[f"create_{kind}_dataset"].return_value = _dataset_mocks[kind]
+
+        mocks["import_text_dataset"] = enter(_dataset_mocks["text"], "import_data")
+
+        mocks["init_automl_image_training_job"] = enter(
+            _AutoMLImageTrainingJob, "__init__", return_value=None
+        )
+        mocks["run_automl_image_training_job"] = enter(_AutoMLImageTrainingJob, "run")
+        mocks["init_custom_training_job"] = enter(
+            _CustomTrainingJob, "__init__", return_value=None
+        )
+        mocks["run_custom_training_job"] = enter(_CustomTrainingJob, "run")
+
+        mocks["init_model"] = enter(_Model, "__init__", return_value=None)
+        mocks["batch_predict_model"] = enter(_Model, "batch_predict")
+
+        mocks["create_batch_prediction_job"] = enter(_BatchPredictionJob, "create")
+
+        mocks["get_endpoint"] = enter(
+            aiplatform, "Endpoint", return_value=mock_endpoint
+        )
+
+        yield mocks
+
+
+def _reset(mock):
+    # Keeps the return values wired in _patched_aiplatform. Resetting a
+    # mock also resets its children, including the mock it returns.
+    mock.reset_mock(side_effect=True)
+    return mock
+
+
 @pytest.fixture
-def mock_sdk_init():
-    with patch.object(aiplatform, "init") as mock:
-        yield mock
+def mock_sdk_init(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["sdk_init"])
 
 
 """
@@ -30,104 +103,91 @@ Dataset Fixtures
 ----------------------------------------------------------------------------
 """
 
-"""Dataset objects returned by SomeDataset(), create(), import_data(), etc. """
+"""Dataset objects returned by SomeDataset(), create(), import_data(), etc.
 
+Samples only pass these through to other SDK calls, so they are plain
+MagicMocks without a spec. They are shared across the session, and fixtures
+that hand them out to a test reset their call history first.
+"""
 
-@pytest.fixture
-def mock_image_dataset():
-    mock = MagicMock(aiplatform.datasets.ImageDataset)
-    yield mock
 
+@pytest.fixture(scope="session")
+def _dataset_mocks():
+    yield {kind: MagicMock() for kind in _DATASET_KINDS}
 
-@pytest.fixture
-def mock_tabular_dataset():
-    mock = MagicMock(aiplatform.datasets.TabularDataset)
-    yield mock
 
+@pytest.fixture(scope="session")
+def mock_image_dataset(_dataset_mocks):
+    yield _dataset_mocks["image"]
 
-@pytest.fixture
-def mock_text_dataset():
-    mock = MagicMock(aiplatform.datasets.TextDataset)
-    yield mock
 
+@pytest.fixture(scope="session")
+def mock_tabular_dataset(_dataset_mocks):
+    yield _dataset_mocks["tabular"]
 
-@pytest.fixture
-def mock_video_dataset():
-    mock = MagicMock(aiplatform.datasets.VideoDataset)
-    yield mock
+
+@pytest.fixture(scope="session")
+def mock_text_dataset(_dataset_mocks):
+    yield _dataset_mocks["text"]
+
+
+@pytest.fixture(scope="session")
+def mock_video_dataset(_dataset_mocks):
+    yield _dataset_mocks["video"]
 
 
 """Mocks for getting an existing Dataset, i.e. ds = aiplatform.ImageDataset(...) """
 
 
 @pytest.fixture
-def mock_get_image_dataset(mock_image_dataset):
-    with patch.object(aiplatform, "ImageDataset") as mock_get_image_dataset:
-        mock_get_image_dataset.return_value = mock_image_dataset
-        yield mock_get_image_dataset
+def mock_get_image_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["get_image_dataset"])
 
 
 @pytest.fixture
-def mock_get_tabular_dataset(mock_tabular_dataset):
-    with patch.object(aiplatform, "TabularDataset") as mock_get_tabular_dataset:
-        mock_get_tabular_dataset.return_value = mock_tabular_dataset
-        yield mock_get_tabular_dataset
+def mock_get_tabular_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["get_tabular_dataset"])
 
 
 @pytest.fixture
-def mock_get_text_dataset(mock_text_dataset):
-    with patch.object(aiplatform, "TextDataset") as mock_get_text_dataset:
-        mock_get_text_dataset.return_value = mock_text_dataset
-        yield mock_get_text_dataset
+def mock_get_text_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["get_text_dataset"])
 
 
 @pytest.fixture
-def mock_get_video_dataset(mock_video_dataset):
-    with patch.object(aiplatform, "VideoDataset") as mock_get_video_dataset:
-        mock_get_video_dataset.return_value = mock_video_dataset
-        yield mock_get_video_dataset
+def mock_get_video_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["get_video_dataset"])
 
 
 """Mocks for creating a new Dataset, i.e. aiplatform.ImageDataset.create(...) """
 
 
 @pytest.fixture
-def mock_create_image_dataset(mock_image_dataset):
-    with patch.object(aiplatform.ImageDataset, "create") as mock_create_image_dataset:
-        mock_create_image_dataset.return_value = mock_image_dataset
-        yield mock_create_image_dataset
+def mock_create_image_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["create_image_dataset"])
 
 
 @pytest.fixture
-def mock_create_tabular_dataset(mock_tabular_dataset):
-    with patch.object(
-        aiplatform.TabularDataset, "create"
-    ) as mock_create_tabular_dataset:
-        mock_create_tabular_dataset.return_value = mock_tabular_dataset
-        yield mock_create_tabular_dataset
+def mock_create_tabular_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["create_tabular_dataset"])
 
 
 @pytest.fixture
-def mock_create_text_dataset(mock_text_dataset):
-    with patch.object(aiplatform.TextDataset, "create") as mock_create_text_dataset:
-        mock_create_text_dataset.return_value = mock_text_dataset
-        yield mock_create_text_dataset
+def mock_create_text_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["create_text_dataset"])
 
 
 @pytest.fixture
-def mock_create_video_dataset(mock_video_dataset):
-    with patch.object(aiplatform.VideoDataset, "create") as mock_create_video_dataset:
-        mock_create_video_dataset.return_value = mock_video_dataset
-        yield mock_create_video_dataset
+def mock_create_video_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["create_video_dataset"])
 
 
 """Mocks for SomeDataset.import_data() """
 
 
 @pytest.fixture
-def mock_import_text_dataset(mock_text_dataset):
-    with patch.object(mock_text_dataset, "import_data") as mock:
-        yield mock
+def mock_import_text_dataset(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["import_text_dataset"])
 
 
 """
@@ -138,31 +198,23 @@ TrainingJob Fixtures
 
 
 @pytest.fixture
-def mock_init_automl_image_training_job():
-    with patch.object(
-        aiplatform.training_jobs.AutoMLImageTrainingJob, "__init__"
-    ) as mock:
-        mock.return_value = None
-        yield mock
+def mock_init_automl_image_training_job(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["init_automl_image_training_job"])
 
 
 @pytest.fixture
-def mock_run_automl_image_training_job():
-    with patch.object(aiplatform.training_jobs.AutoMLImageTrainingJob, "run") as mock:
-        yield mock
+def mock_run_automl_image_training_job(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["run_automl_image_training_job"])
 
 
 @pytest.fixture
-def mock_init_custom_training_job():
-    with patch.object(aiplatform.training_jobs.CustomTrainingJob, "__init__") as mock:
-        mock.return_value = None
-        yield mock
+def mock_init_custom_training_job(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["init_custom_training_job"])
 
 
 @pytest.fixture
-def mock_run_custom_training_job():
-    with patch.object(aiplatform.training_jobs.CustomTrainingJob, "run") as mock:
-        yield mock
+def mock_run_custom_training_job(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["run_custom_training_job"])
 
 
 """
@@ -173,16 +225,13 @@ Model Fixtures
 
 
 @pytest.fixture
-def mock_init_model():
-    with patch.object(aiplatform.models.Model, "__init__") as mock:
-        mock.return_value = None
-        yield mock
+def mock_init_model(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["init_model"])
 
 
 @pytest.fixture
-def mock_batch_predict_model():
-    with patch.object(aiplatform.models.Model, "batch_predict") as mock:
-        yield mock
+def mock_batch_predict_model(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["batch_predict_model"])
 
 
 """
@@ -193,9 +242,8 @@ Job Fixtures
 
 
 @pytest.fixture
-def mock_create_batch_prediction_job():
-    with patch.object(aiplatform.jobs.BatchPredictionJob, "create") as mock:
-        yield mock
+def mock_create_batch_prediction_job(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["create_batch_prediction_job"])
 
 
 """
@@ -205,14 +253,12 @@ Endpoint Fixtures
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_endpoint():
-    mock = MagicMock(aiplatform.models.Endpoint)
+    mock = MagicMock()
     yield mock
 
 
 @pytest.fixture
-def mock_get_endpoint(mock_endpoint):
-    with patch.object(aiplatform, "Endpoint") as mock_get_endpoint:
-        mock_get_endpoint.return_value = mock_endpoint
-        yield mock_get_endpoint
+def mock_get_endpoint(_patched_aiplatform):
+    yield _reset(_patched_aiplatform["get_endpoint"])
@@ -22,7 +22,11 @@ import helpers
 
 PROJECT_ID = os.getenv("BUILD_SPECIFIC_GCLOUD_PROJECT")
 DATASET_ID = "1084241610289446912"  # Permanent 50 Flowers Dataset
-DISPLAY_NAME = f"temp_create_training_pipeline_image_classification_test_{uuid4()}"
+
+
+@pytest.fixture(scope="function")
+def display_name():
+    return f"temp_create_training_pipeline_image_classification_test_{uuid4()}"
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -31,14 +35,14 @@ def teardown(teardown_training_pipeline):
 
 
 def test_ucaip_generated_create_training_pipeline_video_classification_sample(
-    capsys, shared_state
+    capsys, shared_state, display_name
 ):
 
     create_training_pipeline_image_classification_sample.create_training_pipeline_image_classification_sample(
         project=PROJECT_ID,
-        display_name=DISPLAY_NAME,
+        display_name=display_name,
         dataset_id=DATASET_ID,
-        model_display_name=f"Temp Model for {DISPLAY_NAME}",
+        model_display_name=f"Temp Model for {display_name}",
     )
 
     out, _ = capsys.readouterr()
@@ -188,7 +188,7 @@ class TestAutoMLImageTrainingJob:
         importlib.reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_all_parameters(self, mock_model_image):
         """Ensure all private members are set correctly at initalization"""
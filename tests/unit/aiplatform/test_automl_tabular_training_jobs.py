@@ -194,7 +194,7 @@ class TestAutoMLTabularTrainingJob:
         importlib.reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     @pytest.mark.parametrize("sync", [True, False])
     def test_run_call_pipeline_service_create(
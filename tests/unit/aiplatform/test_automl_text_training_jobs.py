@@ -170,7 +170,7 @@ class TestAutoMLTextTrainingJob:
         importlib.reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_all_parameters_classification(self):
         """Ensure all private members are set correctly at initalization"""
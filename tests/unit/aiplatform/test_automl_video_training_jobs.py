@@ -167,7 +167,7 @@ class TestAutoMLVideoTrainingJob:
         importlib.reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_all_parameters(self):
         """Ensure all private members are set correctly at initalization"""
@@ -76,7 +76,7 @@ class TestFutureManager:
         reload(initializer)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     @pytest.mark.parametrize("sync", [True, False])
     def test_create_task(self, sync):
@@ -283,7 +283,7 @@ class TestDataset:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_dataset(self, get_dataset_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -593,7 +593,7 @@ class TestImageDataset:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_dataset_image(self, get_dataset_image_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -756,7 +756,7 @@ class TestTabularDataset:
         aiplatform.init(project=_TEST_PROJECT)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_dataset_tabular(self, get_dataset_tabular_mock):
 
@@ -870,7 +870,7 @@ class TestTextDataset:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_dataset_text(self, get_dataset_text_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -1034,7 +1034,7 @@ class TestVideoDataset:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_dataset_video(self, get_dataset_video_mock):
         aiplatform.init(project=_TEST_PROJECT)
@@ -71,7 +71,7 @@ class TestEndToEnd:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     @pytest.mark.usefixtures(
         "get_dataset_mock",
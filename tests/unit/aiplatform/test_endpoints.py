@@ -338,7 +338,7 @@ class TestEndpoint:
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_constructor(self, create_client_mock):
         aiplatform.init(
@@ -17,7 +17,9 @@
 
 import importlib
 import os
+import pkg_resources
 import pytest
+import sys
 from unittest import mock
 
 import google.auth
@@ -45,7 +47,7 @@ class TestInit:
         importlib.reload(initializer)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_project_sets_project(self):
         initializer.global_config.init(project=_TEST_PROJECT)
@@ -58,6 +60,16 @@ class TestInit:
         monkeypatch.setattr(google.auth, "default", mock_auth_default)
         assert initializer.global_config.project == _TEST_PROJECT
 
+    def test_default_credentials_and_project_are_resolved_once(self):
+        creds = credentials.AnonymousCredentials()
+        with mock.patch.object(google.auth, "default") as auth_default_mock:
+            auth_default_mock.return_value = (creds, _TEST_PROJECT)
+            assert initializer.global_config.credentials is creds
+            assert initializer.global_config.project == _TEST_PROJECT
+            assert initializer.global_config.credentials is creds
+
+        auth_default_mock.assert_called_once_with()
+
     def test_init_location_sets_location(self):
         initializer.global_config.init(location=_TEST_LOCATION)
         assert initializer.global_config.location == _TEST_LOCATION
@@ -123,6 +135,12 @@ class TestInit:
         )
         assert client._transport._credentials == creds
 
+    def test_package_version_matches_distribution(self):
+        assert (
+            initializer._get_package_version()
+            == pkg_resources.get_distribution("google-cloud-aiplatform").version
+        )
+
     def test_create_client_user_agent(self):
         initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
         client = initializer.global_config.create_client(
@@ -135,6 +153,21 @@ class TestInit:
             user_agent = wrapped_method._metadata[0][1]
             assert user_agent.startswith("model-builder/")
 
+    def test_create_client_reuses_client_info(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        with mock.patch.object(
+            initializer, "_get_package_version", wraps=initializer._get_package_version,
+        ) as get_package_version_mock:
+            client = initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+            client_2 = initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+
+        get_package_version_mock.assert_called_once_with()
+        assert client._client_info is client_2._client_info
+
     @pytest.mark.parametrize(
         "init_location, location_override, expected_endpoint",
         [
@@ -160,10 +193,29 @@ class TestInit:
             == expected_endpoint
         )
 
+    def test_get_client_options_reuses_options_per_region(self):
+        initializer.global_config.init(location=_TEST_LOCATION)
+        client_options = initializer.global_config.get_client_options()
+
+        assert initializer.global_config.get_client_options() is client_options
+        assert (
+            initializer.global_config.get_client_options(
+                location_override=_TEST_LOCATION_2
+            )
+            is not client_options
+        )
+
+    def test_get_client_options_with_invalid_location_override_raises(self):
+        initializer.global_config.init(location=_TEST_LOCATION)
+        with pytest.raises(ValueError):
+            initializer.global_config.get_client_options(
+                location_override=_TEST_INVALID_LOCATION
+            )
+
 
 class TestThreadPool:
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     @pytest.mark.parametrize(
         "cpu_count, expected", [(4, 20), (32, 32), (None, 4), (2, 10)]
@@ -172,4 +224,17 @@ class TestThreadPool:
         with mock.patch.object(os, "cpu_count") as cpu_count_mock:
             cpu_count_mock.return_value = cpu_count
             importlib.reload(initializer)
-            assert initializer.global_pool._max_workers == expected
+            assert initializer.get_global_pool()._max_workers == expected
+
+    def test_global_pool_is_created_lazily(self):
+        importlib.reload(initializer)
+        assert initializer._global_pool is None
+        pool = initializer.get_global_pool()
+        assert initializer.get_global_pool() is pool
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7"
+    )
+    def test_global_pool_attribute_returns_global_pool(self):
+        importlib.reload(initializer)
+        assert initializer.global_pool is initializer.get_global_pool()
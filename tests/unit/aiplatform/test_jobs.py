@@ -182,7 +182,7 @@ class TestJob:
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     # Unit Tests
     def test_init_job_class(self):
@@ -341,7 +341,7 @@ class TestBatchPredictionJob:
         reload(aiplatform)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_init_batch_prediction_job(self, get_batch_prediction_job_mock):
         jobs.BatchPredictionJob(
@@ -373,7 +373,7 @@ class TestModel:
         aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
 
     def teardown_method(self):
-        initializer.global_pool.shutdown(wait=True)
+        initializer.get_global_pool().shutdown(wait=True)
 
     def test_constructor_creates_client(self, create_client_mock):
         aiplatform.init(